@@ -1,23 +1,21 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from copy import deepcopy
 from dataclasses import fields, is_dataclass
-from typing import Any, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Type, TypeVar, Union
 
 import humps
 from quart import current_app
-from quart.typing import HeadersValue, ResponseReturnValue as QuartResponseReturnValue, StatusCode
+from quart.typing import ResponseReturnValue as QuartResponseReturnValue
 from werkzeug.datastructures import Headers
 from werkzeug.exceptions import HTTPException
 
 from .typing import Model, ResponseReturnValue, ResponseValue
 
 try:
-    from pydantic import (
-        BaseModel,
-        RootModel,
-        TypeAdapter,
-        ValidationError as PydanticValidationError,
-    )
+    from pydantic import BaseModel, TypeAdapter, ValidationError as PydanticValidationError
     from pydantic.dataclasses import is_pydantic_dataclass
 except ImportError:
     PYDANTIC_INSTALLED = False
@@ -25,9 +23,6 @@ except ImportError:
     class BaseModel:  # type: ignore
         pass
 
-    class RootModel:  # type: ignore
-        pass
-
     class TypeAdapter:  # type: ignore
         pass
 
@@ -72,54 +67,140 @@ MSGSPEC_REF_TEMPLATE = "#/components/schemas/{name}"
 
 T = TypeVar("T", bound=Model)
 
+ModelKind = Literal[
+    "attrs", "collection", "dataclass", "msgspec", "pydantic", "pydantic_dataclass", "other"
+]
+PYDANTIC_KINDS = {"pydantic", "pydantic_dataclass"}
+MSGSPEC_KINDS = {"attrs", "msgspec"}
+# Kinds that either library can convert, with the preference choosing
+GENERIC_KINDS = {"collection", "dataclass"}
+
+
+def _model_kind(model_class: Any) -> ModelKind:
+    return _cached_model_kind(model_class)
+
+
+@lru_cache(maxsize=256)
+def _cached_model_kind(model_class: Any) -> ModelKind:
+    # Note the order matters, as pydantic dataclasses are dataclasses
+    # and only classes can be checked with issubclass. msgspec models
+    # are checked first as a metaclass check is cheap.
+    if MSGSPEC_INSTALLED and isinstance(model_class, type(Struct)):
+        return "msgspec"
+    elif is_pydantic_dataclass(model_class):
+        return "pydantic_dataclass"
+    elif is_dataclass(model_class):
+        return "dataclass"
+    elif not isinstance(model_class, type):
+        return "other"
+    elif is_attrs(model_class):
+        return "attrs"
+    elif issubclass(model_class, BaseModel):
+        return "pydantic"
+    elif issubclass(model_class, (list, dict)):
+        return "collection"
+    else:
+        return "other"
+
+
+@lru_cache(maxsize=1024)
+def _cached_type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def _get_type_adapter(type_: Any) -> TypeAdapter:
+    # Building a TypeAdapter is expensive, so reuse them wherever the
+    # type is hashable (and hence usable as a cache key).
+    try:
+        hash(type_)
+    except TypeError:
+        return TypeAdapter(type_)
+    else:
+        return _cached_type_adapter(type_)
+
+
+# The same response keys are converted on every request, so memoize
+# the conversions (typed as humps treats e.g. 1 and True differently).
+# Request keys are client controlled, and hence are not memoized.
+@lru_cache(maxsize=8192, typed=True)
+def _camelize_key(key: Any) -> Any:
+    return humps.camelize(key)
+
+
+@lru_cache(maxsize=8192, typed=True)
+def _kebabize_key(key: Any) -> Any:
+    return humps.kebabize(key)
+
+
+def _convert_keys(value: Any, convert_key: Callable[[Any], Any]) -> Any:
+    # Only the keys are converted, values are left untouched.
+    if isinstance(value, list):
+        return [
+            _convert_keys(item, convert_key) if isinstance(item, (list, Mapping)) else item
+            for item in value
+        ]
+    elif isinstance(value, Mapping):
+        return {
+            convert_key(key): (
+                _convert_keys(item, convert_key) if isinstance(item, (list, Mapping)) else item
+            )
+            for key, item in value.items()
+        }
+    else:
+        return value
+
+
+def _convert_dumped_keys(value: Any, convert_key: Callable[[Any], Any]) -> Any:
+    # As the dumped value is a new tree owned by model_dump the lists
+    # are converted in place, thereby only the dicts are rebuilt.
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (list, dict)):
+                value[index] = _convert_dumped_keys(item, convert_key)
+        return value
+    elif isinstance(value, dict):
+        return {
+            convert_key(key): (
+                _convert_dumped_keys(item, convert_key) if isinstance(item, (list, dict)) else item
+            )
+            for key, item in value.items()
+        }
+    else:
+        return value
+
 
 def convert_response_return_value(
     result: ResponseReturnValue | HTTPException,
 ) -> QuartResponseReturnValue | HTTPException:
-    value: ResponseValue
-    headers: Optional[HeadersValue] = None
-    status: Optional[StatusCode] = None
-
     if isinstance(result, HTTPException):
         return result
-    elif isinstance(result, tuple):
-        if len(result) == 3:
-            value, status, headers = result  # type: ignore
-        elif len(result) == 2:
-            value, status_or_headers = result
-            if isinstance(status_or_headers, int):
-                status = status_or_headers
-            else:
-                headers = status_or_headers  # type: ignore
+
+    config = current_app.config
+    rest: Optional[list] = None
+    if isinstance(result, tuple):
+        value, *rest = result
     else:
         value = result
 
     value = model_dump(
         value,
-        camelize=current_app.config["QUART_SCHEMA_CONVERT_CASING"],
-        by_alias=current_app.config["QUART_SCHEMA_BY_ALIAS"],
-        preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
-    )
-    headers = model_dump(
-        headers,  # type: ignore
-        kebabize=True,
-        by_alias=current_app.config["QUART_SCHEMA_BY_ALIAS"],
-        preference=current_app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+        camelize=config["QUART_SCHEMA_CONVERT_CASING"],
+        by_alias=config["QUART_SCHEMA_BY_ALIAS"],
+        preference=config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
     )
+    if rest is None:
+        return value
 
-    new_result: ResponseReturnValue
-    if isinstance(result, tuple):
-        if len(result) == 3:
-            new_result = value, status, headers
-        elif len(result) == 2:
-            if status is not None:
-                new_result = value, status
-            else:
-                new_result = value, headers
-    else:
-        new_result = value
-
-    return new_result
+    # The headers, if present, are last i.e. (value, status, headers)
+    # or (value, headers)
+    if len(rest) == 2 or (len(rest) == 1 and not isinstance(rest[0], int)):
+        rest[-1] = model_dump(
+            rest[-1],
+            kebabize=True,
+            by_alias=config["QUART_SCHEMA_BY_ALIAS"],
+            preference=config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+        )
+    return (value, *rest)
 
 
 def model_dump(
@@ -130,31 +211,27 @@ def model_dump(
     kebabize: bool = False,
     preference: Optional[str] = None,
 ) -> dict | list:
-    if is_pydantic_dataclass(raw):  # type: ignore
-        value = RootModel[type(raw)](raw).model_dump()  # type: ignore
-    elif isinstance(raw, BaseModel):
-        value = raw.model_dump(by_alias=by_alias)
-    elif isinstance(raw, Struct) or is_attrs(raw):  # type: ignore
-        value = to_builtins(raw)
-    elif (
-        (isinstance(raw, (list, dict)) or is_dataclass(raw))
-        and PYDANTIC_INSTALLED
-        and preference != "msgspec"
+    if raw is None or isinstance(raw, (str, bytes, int, float, bool)):
+        return raw  # type: ignore
+
+    kind = _model_kind(type(raw))
+    if kind == "pydantic":
+        value = raw.model_dump(by_alias=by_alias)  # type: ignore
+    elif kind == "pydantic_dataclass" or (
+        kind in GENERIC_KINDS and PYDANTIC_INSTALLED and preference != "msgspec"
     ):
-        value = TypeAdapter(type(raw)).dump_python(raw)
-    elif (
-        (isinstance(raw, (list, dict)) or is_dataclass(raw))
-        and MSGSPEC_INSTALLED
-        and preference != "pydantic"
+        value = _get_type_adapter(type(raw)).dump_python(raw)
+    elif kind in MSGSPEC_KINDS or (
+        kind in GENERIC_KINDS and MSGSPEC_INSTALLED and preference != "pydantic"
     ):
         value = to_builtins(raw)
     else:
         return raw  # type: ignore
 
     if camelize:
-        return humps.camelize(value)
+        return _convert_dumped_keys(value, _camelize_key)
     elif kebabize:
-        return humps.kebabize(value)
+        return _convert_dumped_keys(value, _kebabize_key)
     else:
         return value
 
@@ -168,27 +245,16 @@ def model_load(
     preference: Optional[str] = None,
 ) -> T:
     if decamelize:
-        data = humps.decamelize(data)
+        data = _convert_keys(data, humps.decamelize)
 
     try:
-        if (
-            is_pydantic_dataclass(model_class)
-            or issubclass(model_class, BaseModel)
-            or (
-                (isinstance(model_class, (list, dict)) or is_dataclass(model_class))
-                and PYDANTIC_INSTALLED
-                and preference != "msgspec"
-            )
+        kind = _model_kind(model_class)
+        if kind in PYDANTIC_KINDS or (
+            kind == "dataclass" and PYDANTIC_INSTALLED and preference != "msgspec"
         ):
-            return TypeAdapter(model_class).validate_python(data)  # type: ignore
-        elif (
-            issubclass(model_class, Struct)
-            or is_attrs(model_class)
-            or (
-                (isinstance(model_class, (list, dict)) or is_dataclass(model_class))
-                and MSGSPEC_INSTALLED
-                and preference != "pydantic"
-            )
+            return _get_type_adapter(model_class).validate_python(data)  # type: ignore
+        elif kind in MSGSPEC_KINDS or (
+            kind == "dataclass" and MSGSPEC_INSTALLED and preference != "pydantic"
         ):
             return convert(data, model_class, strict=False)  # type: ignore
         else:
@@ -198,51 +264,87 @@ def model_load(
 
 
 def model_schema(model_class: Type[Model], *, preference: Optional[str] = None) -> dict:
-    if (
-        is_pydantic_dataclass(model_class)
-        or issubclass(model_class, BaseModel)
-        or (isinstance(model_class, (list, dict)) and preference != "msgspec")
-        or (is_dataclass(model_class) and preference != "msgspec")
-    ):
-        return TypeAdapter(model_class).json_schema(ref_template=PYDANTIC_REF_TEMPLATE)
-    elif (
-        issubclass(model_class, Struct)
-        or is_attrs(model_class)
-        or (isinstance(model_class, (list, dict)) and preference != "pydantic")
-        or (is_dataclass(model_class) and preference != "pydantic")
-    ):
-        _, schema = schema_components([model_class], ref_template=MSGSPEC_REF_TEMPLATE)
-        return list(schema.values())[0]
+    kind = _model_kind(model_class)
+    if kind in PYDANTIC_KINDS or (kind == "dataclass" and preference != "msgspec"):
+        schema = _pydantic_schema(model_class)
+    elif kind in MSGSPEC_KINDS or (kind == "dataclass" and preference != "pydantic"):
+        schema = _msgspec_schema(model_class)
     else:
         raise TypeError(f"Cannot create schema for {model_class}")
 
+    # The schemas are cached, so copy to allow the caller to modify it
+    return deepcopy(schema)
+
+
+def _pydantic_schema(model_class: Any) -> dict:
+    return _cached_pydantic_schema(model_class)
+
+
+@lru_cache(maxsize=512)
+def _cached_pydantic_schema(model_class: Any) -> dict:
+    return _get_type_adapter(model_class).json_schema(ref_template=PYDANTIC_REF_TEMPLATE)
+
+
+def _msgspec_schema(model_class: Any) -> dict:
+    return _cached_msgspec_schema(model_class)
+
+
+@lru_cache(maxsize=512)
+def _cached_msgspec_schema(model_class: Any) -> dict:
+    _, schema = schema_components([model_class], ref_template=MSGSPEC_REF_TEMPLATE)
+    return next(iter(schema.values()))
+
 
 def convert_headers(
     raw: Union[Headers, dict], model_class: Type[T], exception_class: Type[Exception]
 ) -> T:
-    if is_pydantic_dataclass(model_class):
-        fields_ = set(model_class.__pydantic_fields__.keys())
-    elif is_dataclass(model_class):
-        fields_ = {field.name for field in fields(model_class)}
-    elif issubclass(model_class, BaseModel):
-        fields_ = set(model_class.model_fields.keys())
-    elif is_attrs(model_class):
-        fields_ = {field.name for field in attrs_fields(model_class)}
-    elif issubclass(model_class, Struct):
-        fields_ = set(model_class.__struct_fields__)
-    else:
-        raise TypeError(f"Cannot convert to {model_class}")
+    fields_ = _header_fields(model_class)
 
     result = {}
-    for raw_key in raw.keys():
-        key = humps.dekebabize(raw_key).lower()
-        if key in fields_:
-            if isinstance(raw, Headers):
-                result[key] = ",".join(raw.get_all(raw_key))
-            else:
-                result[key] = raw[raw_key]
+    if isinstance(raw, Headers):
+        # Single pass, as get_all scans every header for each key
+        values: Dict[str, List[str]] = defaultdict(list)
+        for raw_key, value in raw.items():
+            key = fields_.get(raw_key.lower())
+            if key is not None:
+                values[key].append(value)
+        result = {key: ",".join(value) for key, value in values.items()}
+    else:
+        for raw_key, value in raw.items():
+            key = fields_.get(raw_key.lower())
+            if key is not None:
+                result[key] = value
 
     try:
         return model_class(**result)
     except (TypeError, MsgSpecValidationError, ValueError) as error:
         raise exception_class(error)
+
+
+def _header_fields(model_class: Any) -> Dict[str, str]:
+    return _cached_header_fields(model_class)
+
+
+@lru_cache(maxsize=256)
+def _cached_header_fields(model_class: Any) -> Dict[str, str]:
+    # Maps the lowercased header name to the field name, accepting
+    # either the kebab or snake cased form.
+    kind = _model_kind(model_class)
+    if kind == "pydantic_dataclass":
+        names = list(model_class.__pydantic_fields__.keys())
+    elif kind == "dataclass":
+        names = [field.name for field in fields(model_class)]
+    elif kind == "pydantic":
+        names = list(model_class.model_fields.keys())
+    elif kind == "attrs":
+        names = [field.name for field in attrs_fields(model_class)]
+    elif kind == "msgspec":
+        names = list(model_class.__struct_fields__)
+    else:
+        raise TypeError(f"Cannot convert to {model_class}")
+
+    header_fields = {}
+    for name in names:
+        header_fields[name] = name
+        header_fields[name.replace("_", "-")] = name
+    return header_fields
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import inspect
-import re
 from collections import defaultdict
 from functools import wraps
 from types import new_class
 from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import click
 import humps
-from quart import current_app, jsonify, Quart, render_template_string, ResponseReturnValue
+from quart import current_app, jsonify, Quart, render_template, ResponseReturnValue
 from quart.cli import pass_script_info, ScriptInfo
 from quart.json.provider import DefaultJSONProvider
+from quart.testing import QuartClient
 from quart.typing import ResponseReturnValue as QuartResponseReturnValue
+from quart.wrappers import Websocket
 from werkzeug.routing.converters import AnyConverter, NumberConverter
 from werkzeug.routing.rules import Rule
 
@@ -65,8 +67,6 @@ QUART_SCHEMA_OPERATION_ID_ATTRIBUTE = "_quart_schema_operation_id"
 QUART_SCHEMA_SECURITY_ATTRIBUTE = "_quart_schema_security_tag"
 QUART_SCHEMA_DEPRECATED = "_quart_schema_deprecated"
 
-PATH_RE = re.compile("<(?:[^:]*:)?([^>]+)>")
-
 REDOC_TEMPLATE = """
 <head>
   <title>{{ title }}</title>
@@ -134,6 +134,14 @@ class JSONProvider(DefaultJSONProvider):
             return to_jsonable_python(object_)
 
 
+class _TestClient(TestClientMixin, QuartClient):  # type: ignore
+    pass
+
+
+class _Websocket(WebsocketMixin, Websocket):
+    pass
+
+
 def hide(func: Callable) -> Callable:
     """Mark the func as hidden.
 
@@ -246,6 +254,8 @@ class QuartSchema:
 
         self.security = security
 
+        self._openapi_schemas: WeakKeyDictionary[Quart, Tuple[tuple, dict]] = WeakKeyDictionary()
+
         self.external_docs: Optional[ExternalDocumentation] = None
         if external_docs is not None:
             self.external_docs = (
@@ -264,10 +274,19 @@ class QuartSchema:
             self.info = Info(title=app.name, version="0.1.0")
 
         app.json = JSONProvider(app)
-        app.test_client_class = new_class("TestClient", (TestClientMixin, app.test_client_class))
-        app.websocket_class = new_class(  # type: ignore
-            "Websocket", (WebsocketMixin, app.websocket_class)
-        )
+        # Avoid creating new classes (on every init) for the defaults
+        if app.test_client_class is QuartClient:  # type: ignore
+            app.test_client_class = _TestClient  # type: ignore
+        else:
+            app.test_client_class = new_class(
+                "TestClient", (TestClientMixin, app.test_client_class)
+            )
+        if app.websocket_class is Websocket:
+            app.websocket_class = _Websocket
+        else:
+            app.websocket_class = new_class(  # type: ignore
+                "Websocket", (WebsocketMixin, app.websocket_class)
+            )
         app.make_response = wrap_make_response(app.make_response)  # type: ignore
 
         app.config.setdefault(
@@ -303,11 +322,26 @@ class QuartSchema:
 
     @hide
     async def openapi(self) -> ResponseReturnValue:
-        return jsonify(_build_openapi_schema(current_app, self))
+        app = current_app._get_current_object()  # type: ignore
+        # Routes can be added at any time, so the cached schema is only
+        # valid whilst the routes (and conversion config) are unchanged.
+        # Note replacing an existing view function in place is not
+        # detected, as only the counts are compared.
+        key = (
+            len(app.url_map._rules),
+            len(app.view_functions),
+            app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+            app.config["QUART_SCHEMA_CONVERT_CASING"],
+        )
+        cached_key, schema = self._openapi_schemas.get(app, (None, None))
+        if cached_key != key:
+            schema = _build_openapi_schema(app, self)
+            self._openapi_schemas[app] = (key, schema)
+        return jsonify(schema)
 
     @hide
     async def swagger_ui(self) -> str:
-        return await render_template_string(
+        return await _render_template_string(
             SWAGGER_TEMPLATE,
             title=self.info.title,
             openapi_path=self.openapi_path,
@@ -317,7 +351,7 @@ class QuartSchema:
 
     @hide
     async def redoc_ui(self) -> str:
-        return await render_template_string(
+        return await _render_template_string(
             REDOC_TEMPLATE,
             title=self.info.title,
             openapi_path=self.openapi_path,
@@ -326,7 +360,7 @@ class QuartSchema:
 
     @hide
     async def scalar_ui(self) -> str:
-        return await render_template_string(
+        return await _render_template_string(
             SCALAR_TEMPLATE,
             title=self.info.title,
             openapi_path=self.openapi_path,
@@ -354,9 +388,9 @@ def _schema_command(info: ScriptInfo, output: Optional[str]) -> None:
 
 
 def _split_definitions(schema: dict) -> Tuple[dict, dict]:
-    new_schema = schema.copy()
-    definitions = new_schema.pop("$defs", {})
-    return definitions, new_schema
+    # Modifies the schema, model_schema returns a new schema each call
+    definitions = schema.pop("$defs", {})
+    return definitions, schema
 
 
 def _split_convert_definitions(schema: dict, convert_casing: bool) -> Tuple[dict, dict]:
@@ -372,6 +406,15 @@ def _split_convert_definitions(schema: dict, convert_casing: bool) -> Tuple[dict
     return definitions, new_schema
 
 
+async def _render_template_string(source: str, **context: Any) -> str:
+    # Jinja compiles the source on every from_string call, so instead
+    # compile each template once per app.
+    templates = current_app.extensions.setdefault("QUART_SCHEMA_TEMPLATES", {})
+    if source not in templates:
+        templates[source] = current_app.jinja_env.from_string(source)
+    return await render_template(templates[source], **context)
+
+
 def wrap_make_response(func: Callable) -> Callable:
     @wraps(func)
     async def decorator(result: ResponseReturnValue) -> QuartResponseReturnValue:
@@ -449,7 +492,34 @@ def security_scheme(schemes: Iterable[Dict[str, List[str]]]) -> Callable:
     return decorator
 
 
-def _build_path(func: Callable, rule: Rule, app: Quart) -> Tuple[dict, dict]:
+# Operations built per view function, keyed by the function object rather
+# than stored on it, as functools.wraps copies the function's __dict__.
+_operations: WeakKeyDictionary[Callable, Dict[tuple, Tuple[dict, dict, dict]]] = WeakKeyDictionary()
+
+
+def _get_operation(func: Callable, app: Quart) -> Tuple[dict, dict]:
+    # The operation depends only on the view function's attributes and
+    # the app's conversion configuration, so reuse it whilst neither
+    # has changed.
+    key = (
+        app.config["QUART_SCHEMA_CONVERSION_PREFERENCE"],
+        app.config["QUART_SCHEMA_CONVERT_CASING"],
+    )
+    attributes = getattr(func, "__dict__", None)
+    try:
+        operations = _operations.setdefault(func, {})
+    except TypeError:  # Not weak referenceable
+        return _build_operation(func, app)
+
+    cached = operations.get(key)
+    if cached is None or attributes is None or cached[0] != attributes:
+        operation_object, components = _build_operation(func, app)
+        operations[key] = (dict(attributes or {}), operation_object, components)
+        return operation_object, components
+    return cached[1], cached[2]
+
+
+def _build_operation(func: Callable, app: Quart) -> Tuple[dict, dict]:
     components = {}
     operation_object: Dict[str, Any] = {
         "parameters": [],
@@ -564,15 +634,22 @@ def _build_path(func: Callable, rule: Rule, app: Quart) -> Tuple[dict, dict]:
 
             operation_object["parameters"].append(param)
 
+    return operation_object, components
+
+
+def _build_path(func: Callable, rule: Rule, app: Quart) -> Tuple[dict, dict]:
+    operation_object, components = _get_operation(func, app)
+    # The operation is cached, so copy before adding the path parameters
+    operation_object = {**operation_object, "parameters": list(operation_object["parameters"])}
+
     for name, converter in rule._converters.items():
         type_ = "string"
         if isinstance(converter, NumberConverter):
             type_ = "number"
 
+        schema = {"type": type_}
         if isinstance(converter, AnyConverter):
             schema["enum"] = list(converter.items)
-        else:
-            schema = {"type": type_}
 
         operation_object["parameters"].append(
             {
@@ -583,7 +660,7 @@ def _build_path(func: Callable, rule: Rule, app: Quart) -> Tuple[dict, dict]:
             }
         )
 
-    path = re.sub(PATH_RE, r"{\1}", rule.rule)
+    path = _convert_path(rule.rule)
     paths = {path: {}}  # type: ignore
 
     for method in rule.methods:
@@ -591,18 +668,42 @@ def _build_path(func: Callable, rule: Rule, app: Quart) -> Tuple[dict, dict]:
             continue
 
         per_method_operation_object = operation_object.copy()
+        method = method.lower()
 
         if getattr(func, QUART_SCHEMA_OPERATION_ID_ATTRIBUTE, None) is not None:
             per_method_operation_object[
                 "operationId"
-            ] = f"{method.lower()}_{getattr(func, QUART_SCHEMA_OPERATION_ID_ATTRIBUTE)}"
+            ] = f"{method}_{getattr(func, QUART_SCHEMA_OPERATION_ID_ATTRIBUTE)}"
         else:
-            per_method_operation_object["operationId"] = f"{method.lower()}_{func.__name__}"
+            per_method_operation_object["operationId"] = f"{method}_{func.__name__}"
 
-        paths[path][method.lower()] = per_method_operation_object
+        paths[path][method] = per_method_operation_object
     return paths, components
 
 
+def _convert_path(rule: str) -> str:
+    # Converts the rule's variables to OpenAPI path parameters, e.g.
+    # /<int:id> to /{id}.
+    start = rule.find("<")
+    if start == -1:
+        return rule
+
+    parts = []
+    position = 0
+    while start != -1:
+        end = rule.find(">", start)
+        if end == -1:
+            break
+        name = rule[start + 1 : end].rpartition(":")[2]
+        if name != "":
+            parts.append(rule[position:start])
+            parts.append(f"{{{name}}}")
+            position = end + 1
+        start = rule.find("<", end + 1)
+    parts.append(rule[position:])
+    return "".join(parts)
+
+
 def _build_full_schema(extension: QuartSchema, paths: dict, component_schemas: dict) -> dict:
     components = {"schemas": component_schemas}
     if extension.security_schemes is not None:
@@ -1,5 +1,7 @@
+from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
-from typing import Type, Union
+from typing import Optional, Type, Union
 from uuid import UUID
 
 import pytest
@@ -41,6 +43,34 @@ async def test_make_response_no_model() -> None:
     assert response.headers["X-1"] == "2"
 
 
+@dataclass
+class ResponseHeaders:
+    x_name: str
+
+
+@pytest.mark.parametrize(
+    "result, status, x_name",
+    [
+        (({"a": 1}, 201), 201, None),
+        (({"a": 1}, ResponseHeaders(x_name="bob")), 200, "bob"),
+        (({"a": 1}, 201, ResponseHeaders(x_name="bob")), 201, "bob"),
+    ],
+)
+async def test_make_response_tuple(result: tuple, status: int, x_name: Optional[str]) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    async def index() -> ResponseReturnValue:
+        return result
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert (await response.get_json()) == {"a": 1}
+    assert response.status_code == status
+    assert response.headers.get("X-Name") == x_name
+
+
 class PydanticEncoded(BaseModel):
     a: UUID
     b: Path
@@ -57,3 +87,36 @@ async def test_make_pydantic_encoder_response() -> None:
     test_client = app.test_client()
     response = await test_client.get("/")
     assert (await response.get_json()) == {"a": "23ef2e02-1c20-49de-b05e-e9fe2431c474", "b": "/"}
+
+
+class PydanticNative(BaseModel):
+    b: bytes
+    f: float
+    td: timedelta
+
+
+async def test_make_pydantic_native_response() -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")  # type: ignore
+    async def index() -> PydanticNative:
+        return PydanticNative(b=b"hello", f=float("inf"), td=timedelta(hours=1, microseconds=5))
+
+    test_client = app.test_client()
+    response = await test_client.get("/")
+    assert (
+        await response.get_data(as_text=True)
+    ) == '{"b":"hello","f":Infinity,"td":"PT1H0.000005S"}\n'
+
+
+@pytest.mark.parametrize("path", ["/docs", "/redocs", "/scalar"])
+async def test_documentation_ui(path: str) -> None:
+    app = Quart(__name__)
+    QuartSchema(app, info={"title": "Test API", "version": "0.1.0"})
+
+    test_client = app.test_client()
+    for _ in range(2):
+        response = await test_client.get(path)
+        assert response.status_code == 200
+        assert "<title>Test API</title>" in await response.get_data(as_text=True)
@@ -6,8 +6,16 @@ from attrs import define
 from msgspec import Struct
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass as pydantic_dataclass
-
-from quart_schema.conversion import convert_headers, model_dump, model_load, model_schema
+from werkzeug.datastructures import Headers
+
+from quart_schema.conversion import (
+    _get_type_adapter,
+    _model_kind,
+    convert_headers,
+    model_dump,
+    model_load,
+    model_schema,
+)
 from .helpers import ADetails, DCDetails, MDetails, PyDCDetails, PyDetails
 
 
@@ -45,6 +53,22 @@ def test_model_dump_list(
     ) == [{"name": "bob", "age": 2}, {"name": "jim", "age": 3}]
 
 
+def test_model_dump_camelize() -> None:
+    assert model_dump(
+        {"snake_case": [{"inner_key": "snake_value"}]}, by_alias=False, camelize=True
+    ) == {"snakeCase": [{"innerKey": "snake_value"}]}
+
+
+@pytest.mark.parametrize("preference", ["msgspec", "pydantic"])
+def test_model_dump_camelize_unmodified(preference: str) -> None:
+    raw = [[{"snake_case": 1}], {"other_case": [{"snake_case": 2}]}]
+    assert model_dump(raw, by_alias=False, camelize=True, preference=preference) == [
+        [{"snakeCase": 1}],
+        {"otherCase": [{"snakeCase": 2}]},
+    ]
+    assert raw == [[{"snake_case": 1}], {"other_case": [{"snake_case": 2}]}]
+
+
 @pytest.mark.parametrize("type_", [ADetails, DCDetails, MDetails, PyDetails, PyDCDetails])
 def test_model_load(
     type_: Type[Union[ADetails, DCDetails, MDetails, PyDetails, PyDCDetails]]
@@ -62,6 +86,26 @@ def test_model_load_error(
         model_load({"name": "bob", "age": "two"}, type_, exception_class=ValidationError)
 
 
+@pytest.mark.parametrize(
+    "type_, kind",
+    [
+        (ADetails, "attrs"),
+        (DCDetails, "dataclass"),
+        (MDetails, "msgspec"),
+        (PyDetails, "pydantic"),
+        (PyDCDetails, "pydantic_dataclass"),
+        (list, "collection"),
+        (str, "other"),
+    ],
+)
+def test_model_kind(type_: type, kind: str) -> None:
+    assert _model_kind(type_) == kind
+
+
+def test_type_adapter_reused() -> None:
+    assert _get_type_adapter(PyDetails) is _get_type_adapter(PyDetails)
+
+
 @pytest.mark.parametrize("type_", [ADetails, DCDetails, MDetails])
 def test_model_schema_msgspec(type_: Type[Union[ADetails, DCDetails, MDetails]]) -> None:
     assert model_schema(type_, preference="msgspec") == {
@@ -92,6 +136,13 @@ def test_model_schema_pydantic(type_: Type[Union[DCDetails, PyDetails, PyDCDetai
     }
 
 
+@pytest.mark.parametrize("type_, preference", [(MDetails, "msgspec"), (PyDetails, "pydantic")])
+def test_model_schema_cached_copy(type_: Type[Union[MDetails, PyDetails]], preference: str) -> None:
+    schema = model_schema(type_, preference=preference)
+    schema["properties"].pop("name")
+    assert "name" in model_schema(type_, preference=preference)["properties"]
+
+
 @define
 class AHeaders:
     x_info: str
@@ -127,3 +178,10 @@ def test_convert_headers(
         type_,
         exception_class=ValidationError,
     ) == type_(x_info="ABC")
+
+
+def test_convert_headers_multiple_values() -> None:
+    headers = Headers([("X-Info", "ABC"), ("Other", "2"), ("x-info", "DEF")])
+    assert convert_headers(headers, DCHeaders, exception_class=ValidationError) == DCHeaders(
+        x_info="ABC,DEF"
+    )
@@ -1,15 +1,17 @@
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import pytest
 from pydantic import Field
 from pydantic.dataclasses import dataclass
-from quart import Quart
+from quart import Blueprint, Quart
 
 from quart_schema import (
     deprecate,
+    extension,
     operation_id,
     QuartSchema,
     security_scheme,
+    tag,
     validate_headers,
     validate_querystring,
     validate_request,
@@ -265,3 +267,92 @@ async def test_openapi_refs() -> None:
         "properties"
     ]["resources"]["items"]["$ref"]
     assert ref[len("#/components/schemas/") :] in schema["components"]["schemas"].keys()
+
+
+async def test_openapi_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = Quart(__name__)
+    QuartSchema(app)
+
+    @app.route("/")
+    @validate_response(Employees)
+    async def index() -> Employees:
+        return Employees(resources=[Employee(name="bob")])
+
+    calls = []
+    build_openapi_schema = extension._build_openapi_schema
+
+    def _build(*args: Any) -> dict:
+        calls.append(args)
+        return build_openapi_schema(*args)
+
+    monkeypatch.setattr(extension, "_build_openapi_schema", _build)
+
+    test_client = app.test_client()
+    first = await (await test_client.get("/openapi.json")).get_json()
+    second = await (await test_client.get("/openapi.json")).get_json()
+    assert first == second
+    assert len(calls) == 1
+
+    @app.route("/later")
+    async def later() -> str:
+        return ""
+
+    third = await (await test_client.get("/openapi.json")).get_json()
+    assert list(third["paths"].keys()) == ["/", "/later"]
+    assert len(calls) == 2
+
+
+async def test_openapi_shared_view() -> None:
+    blueprint = Blueprint("blueprint", __name__)
+
+    @blueprint.route("/<any(a, b):kind>")
+    @validate_querystring(QueryItem)
+    async def index(kind: str) -> str:
+        return kind
+
+    schemas = []
+    for convert_casing in (False, True):
+        app = Quart(__name__)
+        QuartSchema(app, convert_casing=convert_casing)
+        app.register_blueprint(blueprint)
+        test_client = app.test_client()
+        schemas.append(await (await test_client.get("/openapi.json")).get_json())
+
+    for schema, name in zip(schemas, ("count_le", "countLe")):
+        parameters = schema["paths"]["/{kind}"]["get"]["parameters"]
+        assert [parameter["name"] for parameter in parameters] == [name, "kind"]
+        assert sorted(parameters[1]["schema"]["enum"]) == ["a", "b"]
+
+
+async def _view() -> Employees:
+    return Employees(resources=[Employee(name="bob")])
+
+
+async def test_openapi_wrapped_view() -> None:
+    first_app = Quart(__name__)
+    QuartSchema(first_app)
+    first_app.add_url_rule("/", "index", _view)
+    first = await (await first_app.test_client().get("/openapi.json")).get_json()
+    assert first["paths"]["/"]["get"]["responses"] == {}
+
+    second_app = Quart(__name__)
+    QuartSchema(second_app)
+    second_app.add_url_rule("/", "index", tag(["a"])(validate_response(Employees)(_view)))
+    second = await (await second_app.test_client().get("/openapi.json")).get_json()
+    operation = second["paths"]["/"]["get"]
+    assert "200" in operation["responses"]
+    assert operation["tags"] == ["a"]
+
+
+@pytest.mark.parametrize(
+    "rule, expected",
+    [
+        ("/", "/"),
+        ("/<id>", "/{id}"),
+        ("/<int:id>/<name>", "/{id}/{name}"),
+        ("/<name>/<int:id>", "/{name}/{id}"),
+        ("/<any(a, b):kind>/items", "/{kind}/items"),
+    ],
+)
+def test_convert_path(rule: str, expected: str) -> None:
+    assert extension._convert_path(rule) == expected